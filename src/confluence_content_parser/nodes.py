@@ -22,9 +22,12 @@ class Node(BaseModel, ABC):
 
     def walk(self) -> Iterator[Node]:
         """Walk through this node and all its descendants."""
-        yield self
-        for child in self.get_children():
-            yield from child.walk()
+        # Explicit stack instead of nested generators: each step is O(1) regardless of depth
+        stack: list[Node] = [self]
+        while stack:
+            node = stack.pop()
+            yield node
+            stack.extend(reversed(node.get_children()))
 
     def get_children(self) -> list[Node]:
         """Get direct children of this node. Override in subclasses."""
@@ -89,11 +92,18 @@ class Node(BaseModel, ABC):
                     results.append(node)
             return results
 
+        # Resolve which requested types a concrete class matches once, then bucket nodes in a single pass
         result_lists: list[list[Node]] = [[] for _ in node_types]
+        matches: dict[type[Node], list[list[Node]]] = {}
         for node in self.walk():
-            for i, node_type in enumerate(node_types):
-                if isinstance(node, node_type):
-                    result_lists[i].append(node)
+            node_class = type(node)
+            buckets = matches.get(node_class)
+            if buckets is None:
+                buckets = matches[node_class] = [
+                    results for results, node_type in zip(result_lists, node_types) if issubclass(node_class, node_type)
+                ]
+            for results in buckets:
+                results.append(node)
 
         return tuple(result_lists)
 
@@ -108,21 +118,20 @@ class ContainerElement(Node):
         return self.children
 
     def to_text(self) -> str:
+        # Block-level children are separated by blank lines; detect them in the same pass as the text
         parts = []
+        has_block_children = False
         for child in self.children:
+            has_block_children = has_block_children or child.is_block_level
             child_text = child.to_text()
             if clean_child_text := child_text.strip():
                 parts.append(clean_child_text)
 
-        if self._has_block_children():
+        if has_block_children:
             return "\n\n".join(parts)
         else:
             return " ".join(parts)
 
-    def _has_block_children(self) -> bool:
-        """Check if this container has block-level children that should be separated by newlines."""
-        return any(child.is_block_level for child in self.children)
-
 
 class Fragment(ContainerElement):
     """Neutral container for multiple top-level nodes (non-rendering)."""
@@ -1,7 +1,13 @@
 from __future__ import annotations
 
-import xml.etree.ElementTree as ET
-from collections.abc import Callable, Iterator
+import codecs
+import re
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from functools import lru_cache
+from types import MappingProxyType
+from typing import ClassVar, cast
+
+from lxml import etree
 
 from .document import ConfluenceDocument
 from .nodes import (
@@ -55,6 +61,123 @@ from .nodes import (
     ViewPdfMacro,
 )
 
+_RESOURCE_IDENTIFIER_FIELDS = {
+    "space-key": "space_key",
+    "content-title": "content_title",
+    "content-id": "content_id",
+    "posting-day": "posting_day",
+    "filename": "filename",
+    "value": "value",
+    "key": "key",
+    "parameter": "parameter",
+    "account-id": "account_id",
+    "local-id": "local_id",
+    "userkey": "userkey",
+    "version-at-save": "version_at_save",
+}
+
+_IMAGE_FIELDS = {
+    "src": "src",
+    "alt": "alt",
+    "title": "title",
+    "width": "width",
+    "height": "height",
+    "align": "alignment",
+    "layout": "layout",
+    "original-height": "original_height",
+    "original-width": "original_width",
+    "custom-width": "custom_width",
+}
+
+# Link fields copied from the link's resource identifier when the link is built
+_LINK_RESOURCE_FIELDS = ("space_key", "content_title", "posting_day", "version_at_save", "account_id", "filename")
+
+_STREAM_CHUNK_SIZE = 64 * 1024
+
+
+# Characters that need the XML parser: markup, entity references, and anything XML would reject or normalize.
+_MARKUP_RE = re.compile(r"[<&\r\x00-\x08\x0b\x0c\x0e-\x1f\ufffe\uffff]|]]>")
+
+_HEADING_TYPES = {heading_type.value: heading_type for heading_type in HeadingType}
+_TEXT_EFFECT_TYPES = {effect_type.value: effect_type for effect_type in TextEffectType}
+_LIST_TYPES = {list_type.value: list_type for list_type in ListType}
+_RESOURCE_IDENTIFIER_TYPES = {resource_type.value: resource_type for resource_type in ResourceIdentifierType}
+
+_PANEL_MACRO_TYPES = {
+    "tip": PanelMacroType.SUCCESS,
+    "note": PanelMacroType.WARNING,
+    "warning": PanelMacroType.ERROR,
+    "info": PanelMacroType.INFO,
+}
+
+# Elements dropped without a diagnostic, together with their subtrees
+_SKIPPED_ELEMENTS = frozenset({"colgroup", "col", "adf-fallback", "inline-comment-marker"})
+
+_ADF_PANEL_TYPES = {"note": PanelMacroType.NOTE}
+# Alternative spellings of ADF attribute keys; the last one present on a node wins
+_ADF_ATTRIBUTE_ALIASES = {"bgColor": "bg-color"}
+_DECISION_STATES = {state.value: state for state in DecisionListItemState}
+
+# Resource identifier type -> type of the link that wraps it
+_RESOURCE_LINK_TYPES = {
+    ResourceIdentifierType.PAGE: LinkType.PAGE,
+    ResourceIdentifierType.BLOG_POST: LinkType.BLOG_POST,
+    ResourceIdentifierType.USER: LinkType.USER,
+    ResourceIdentifierType.SPACE: LinkType.SPACE,
+    ResourceIdentifierType.ATTACHMENT: LinkType.ATTACHMENT,
+}
+
+_BOOL_MAP = {"true": True, "1": True, "yes": True, "false": False, "0": False, "no": False}
+
+
+@lru_cache(maxsize=512)
+def _strip_namespace(tag: str) -> str:
+    """Return the local name of a ``{namespace}local`` tag.
+
+    Pages reuse a few dozen tags, so the cache keeps each split to once per tag and hands back
+    the same string for a repeated tag, while the bound keeps tag names from arbitrary input
+    from growing it without limit.
+    """
+    return tag.rpartition("}")[2] if tag[:1] == "{" else tag
+
+
+@lru_cache(maxsize=2048)
+def _parse_style_declarations(style: str) -> tuple[tuple[str, str], ...]:
+    """Split an inline CSS style string into lowercased property/value pairs.
+
+    Pages repeat the same few style strings across many cells and paragraphs, so results are
+    cached per exact string; they are tuples so a cached entry cannot be mutated by a caller.
+    """
+    declarations = []
+    for declaration in style.split(";"):
+        prop, separator, value = declaration.partition(":")
+        if separator:
+            prop = prop.strip().lower()
+            value = value.strip()
+
+            if prop and value:
+                declarations.append((prop, value))
+
+    return tuple(declarations)
+
+
+def _parse_int(value: str | None) -> int | None:
+    """Convert an integer attribute value to int, or None when it is missing or not a number."""
+    if not value:
+        return None
+    value = value.strip()
+    digits = value[1:] if value[:1] in ("+", "-") else value
+    return int(value) if digits.isdecimal() else None
+
+
+def _parse_bool(value: str | None, default: bool = False) -> bool:
+    """Convert a boolean-ish attribute or parameter value to bool, case-insensitively."""
+    return _BOOL_MAP.get(value.strip().lower(), default) if value else default
+
+
+# Element, macro and ADF-node handlers, called as handler(parser, element)
+_Handler = Callable[["ConfluenceParser", etree._Element], Node | None]
+
 
 class ParsingError(Exception):
     """Raised when parsing fails with diagnostics."""
@@ -71,110 +194,9 @@ class ConfluenceParser:
     NS_RI = "http://www.atlassian.com/schema/confluence/4/ri/"
     NS_AT = "http://www.atlassian.com/schema/confluence/4/at/"
 
-    def __init__(self, *, raise_on_finish: bool = True):
-        self.diagnostics: list[str] = []
-        self.raise_on_finish = raise_on_finish
-        self._skipped_elements = {"colgroup", "col", "adf-fallback", "inline-comment-marker"}
-        self._element_parsers: dict[str, Callable[[ET.Element], Node | None]] = {
-            "macro": self._parse_macro,
-            "structured-macro": self._parse_structured_macro,
-            "layout": self._parse_layout,
-            "layout-section": self._parse_layout_section,
-            "layout-cell": self._parse_layout_cell,
-            "h1": self._parse_heading,
-            "h2": self._parse_heading,
-            "h3": self._parse_heading,
-            "h4": self._parse_heading,
-            "h5": self._parse_heading,
-            "h6": self._parse_heading,
-            "strong": self._parse_text_effect,
-            "em": self._parse_text_effect,
-            "u": self._parse_text_effect,
-            "del": self._parse_text_effect,
-            "code": self._parse_text_effect,
-            "sub": self._parse_text_effect,
-            "sup": self._parse_text_effect,
-            "blockquote": self._parse_text_effect,
-            "span": self._parse_text_effect,
-            "p": self._parse_text_break,
-            "br": self._parse_text_break,
-            "hr": self._parse_text_break,
-            "ul": self._parse_list,
-            "ol": self._parse_list,
-            "li": self._parse_list_item,
-            "task-list": self._parse_list,
-            "task": self._parse_list_item,
-            "link": self._parse_link,
-            "link-body": self._parse_link_body,
-            "a": self._parse_external_link,
-            "image": self._parse_image,
-            "emoticon": self._parse_emoticon,
-            "placeholder": self._parse_placeholder,
-            "time": self._parse_time,
-            "page": self._parse_resource_identifier,
-            "blog-post": self._parse_resource_identifier,
-            "attachment": self._parse_resource_identifier,
-            "url": self._parse_resource_identifier,
-            "shortcut": self._parse_resource_identifier,
-            "user": self._parse_resource_identifier,
-            "space": self._parse_resource_identifier,
-            "content-entity": self._parse_resource_identifier,
-            "table": self._parse_table,
-            "tbody": self._parse_table_body,
-            "tr": self._parse_table_row,
-            "th": self._parse_table_cell,
-            "td": self._parse_table_cell,
-            "adf-extension": self._parse_adf_extension,
-        }
-        self._macro_parsers: dict[str, Callable[[ET.Element], Node | None]] = {
-            "panel": self._parse_panel_macro,
-            "tip": self._parse_panel_macro,
-            "note": self._parse_panel_macro,
-            "warning": self._parse_panel_macro,
-            "info": self._parse_panel_macro,
-            "code": self._parse_code_macro,
-            "details": self._parse_details_macro,
-            "expand": self._parse_expand_macro,
-            "status": self._parse_status_macro,
-            "toc": self._parse_toc_macro,
-            "jira": self._parse_jira_macro,
-            "include": self._parse_include_macro,
-            "tasks-report-macro": self._parse_tasks_report_macro,
-            "excerpt-include": self._parse_excerpt_include_macro,
-            "attachments": self._parse_attachments_macro,
-            "viewpdf": self._parse_viewpdf_macro,
-            "view-file": self._parse_view_file_macro,
-            "profile": self._parse_profile_macro,
-            "anchor": self._parse_anchor_macro,
-            "excerpt": self._parse_excerpt_macro,
-        }
-
-    def parse(self, content: str) -> ConfluenceDocument:
-        """Parse Confluence storage-format XML into a ConfluenceDocument."""
-        self.diagnostics.clear()
-
-        try:
-            content = self._normalize_content(content)
-            root_element = ET.fromstring(content)
-        except ET.ParseError as e:
-            self.diagnostics.append(f"XML parsing failed: {e}")
-            return ConfluenceDocument(metadata={"diagnostics": self.diagnostics})
-
-        children = self._parse_children(root_element)
-        root_node = self._consolidate_root(children)
-
-        if self.raise_on_finish and self.diagnostics:
-            raise ParsingError(self.diagnostics[:])
-
-        return ConfluenceDocument(root=root_node, metadata={"diagnostics": self.diagnostics})
-
-    def _normalize_content(self, content: str) -> str:
-        """Add namespace declarations and entity definitions to ensure proper XML parsing."""
-        content = content.strip()
-
-        content = self._fix_unicode_surrogates(content)
-
-        return f"""<?xml version="1.0" encoding="UTF-8"?>
+    # Synthetic root wrapped around every page body: namespace declarations plus the HTML
+    # entities Confluence storage format uses. Encoded once and fed around the content.
+    _DOCUMENT_PROLOGUE: ClassVar[bytes] = f"""<?xml version="1.0" encoding="UTF-8"?>
         <!DOCTYPE root [
             <!ENTITY nbsp "&#160;">
             <!ENTITY ndash "&#8211;">
@@ -190,29 +212,127 @@ class ConfluenceParser:
             <!ENTITY zwj "&#8205;">
             <!ENTITY zwnj "&#8204;">
         ]>
-        <root xmlns:ac="{self.NS_AC}"
-            xmlns:ri="{self.NS_RI}"
-            xmlns:at="{self.NS_AT}">
-            {content}
+        <root xmlns:ac="{NS_AC}"
+            xmlns:ri="{NS_RI}"
+            xmlns:at="{NS_AT}">
+            """.encode()
+    _DOCUMENT_EPILOGUE: ClassVar[bytes] = b"""
         </root>"""
 
+    # Attribute key -> (field, rank); the rank follows _get_attr's bare, ac, ri, at lookup order
+    _resource_identifier_keys: ClassVar[dict[str, tuple[str, int]]] = {
+        f"{{{ns}}}{attr}" if ns else attr: (field, rank)
+        for rank, ns in enumerate(("", NS_AC, NS_RI, NS_AT))
+        for attr, field in _RESOURCE_IDENTIFIER_FIELDS.items()
+    }
+    # Storage format spells parameter names as ac:name; read that key directly before the general lookup
+    _AC_NAME: ClassVar[str] = f"{{{NS_AC}}}name"
+
+    # Local attribute name -> its ac/ri/at qualified keys, filled in as handlers ask for names
+    _qualified_attribute_keys: ClassVar[dict[str, tuple[str, ...]]] = {}
+    _image_attribute_keys: ClassVar[dict[str, tuple[str, int]]] = {
+        f"{{{ns}}}{attr}" if ns else attr: (field, rank)
+        for rank, ns in enumerate(("", NS_AC, NS_RI, NS_AT))
+        for attr, field in _IMAGE_FIELDS.items()
+    }
+
+    def __init__(self, *, raise_on_finish: bool = True, skip_elements: Iterable[str] = ()):
+        """Create a parser.
+
+        ``skip_elements`` names local tags to drop together with their subtrees, wherever they
+        appear: as blocks and inline content, and as the bodies, parameters and other parts
+        handlers read from macros, images, tasks and ADF nodes.
+        """
+        self.diagnostics: list[str] = []
+        self._diagnostics_seen: set[str] = set()
+        self.raise_on_finish = raise_on_finish
+        if isinstance(skip_elements, str):
+            raise TypeError("skip_elements must be an iterable of tag names, not a single string")
+        self._skipped_elements = _SKIPPED_ELEMENTS.union(skip_elements)
+
+    def __init_subclass__(cls, **kwargs: object) -> None:
+        """Rebind the dispatch tables to the subclass so overridden handler methods are used.
+
+        Only handlers that are methods of the class hierarchy are resolved again by name; other
+        callables a subclass put in a table, such as partials, are kept as they are.
+        """
+        super().__init_subclass__(**kwargs)
+        for table_name in ("_element_parsers", "_macro_parsers", "_adf_node_parsers"):
+            rebound = {}
+            for key, handler in getattr(cls, table_name).items():
+                name = getattr(handler, "__name__", None)
+                if name is not None and any(vars(base).get(name) is handler for base in cls.__mro__):
+                    handler = getattr(cls, name)
+                rebound[key] = handler
+            setattr(cls, table_name, MappingProxyType(rebound))
+
+    def parse(self, content: str) -> ConfluenceDocument:
+        """Parse Confluence storage-format XML into a ConfluenceDocument."""
+        return self._parse(content)
+
+    def parse_bytes(self, data: bytes) -> ConfluenceDocument:
+        """Parse UTF-8 encoded Confluence storage-format XML into a ConfluenceDocument.
+
+        The bytes are handed to the XML parser as they are, without being decoded to ``str`` and
+        encoded again first. Use this when content arrives as raw bytes, e.g. an HTTP response
+        body. Invalid UTF-8 is reported as an XML parsing failure.
+        """
+        return self._parse(data)
+
+    def _parse(self, content: str | bytes) -> ConfluenceDocument:
+        """Parse content and raise on diagnostics as configured."""
+        document, well_formed = self._parse_document(content)
+
+        if well_formed and self.raise_on_finish and self.diagnostics:
+            raise ParsingError(self.diagnostics[:])
+
+        return document
+
+    def _parse_document(self, content: str | bytes) -> tuple[ConfluenceDocument, bool]:
+        """Parse content into a document, reporting whether the XML itself was well-formed."""
+        self.diagnostics.clear()
+        self._diagnostics_seen.clear()
+
+        if isinstance(content, bytes):
+            source = content.removeprefix(codecs.BOM_UTF8).strip()
+        else:
+            content = content.strip()
+            try:
+                source = content.encode("utf-8")
+            except UnicodeEncodeError:
+                content = self._fix_unicode_surrogates(content)
+                source = content.encode("utf-8")
+            if _MARKUP_RE.search(content) is None:
+                text = content.strip()
+                root = Text(text=text) if text else None
+                return ConfluenceDocument(root=root, metadata={"diagnostics": self.diagnostics[:]}), True
+
+        try:
+            children = self._parse_stream(source)
+        except etree.ParseError as e:
+            # Diagnostics from elements handled before the error describe a document that is discarded
+            self.diagnostics.clear()
+            self._diagnostics_seen.clear()
+            self._add_diagnostic(f"XML parsing failed: {e}")
+            return ConfluenceDocument(metadata={"diagnostics": self.diagnostics[:]}), False
+
+        root_node = self._consolidate_root(children)
+        return ConfluenceDocument(root=root_node, metadata={"diagnostics": self.diagnostics[:]}), True
+
+    def _add_diagnostic(self, message: str) -> None:
+        """Record a diagnostic once per document, however often the same problem repeats."""
+        if message not in self._diagnostics_seen:
+            self._diagnostics_seen.add(message)
+            self.diagnostics.append(message)
+
     def _fix_unicode_surrogates(self, content: str) -> str:
         """Fix Unicode surrogate characters that can cause XML parsing issues."""
         try:
             content.encode("utf-8")
             return content
         except UnicodeEncodeError:
-            result = []
-            i = 0
-            while i < len(content):
-                char = content[i]
-                try:
-                    char.encode("utf-8")
-                    result.append(char)
-                except UnicodeEncodeError:
-                    pass
-                i += 1
-            return "".join(result)
+            # Lone surrogates are the only code points UTF-8 cannot encode; the codec drops them in C
+            return content.encode("utf-8", "ignore").decode("utf-8")
 
     def _consolidate_root(self, children: list[Node]) -> Node | None:
         """Convert parsed children into appropriate root node structure."""
@@ -223,42 +343,107 @@ class ConfluenceParser:
         else:
             return Fragment(children=children)
 
-    def _parse_children(self, element: ET.Element) -> list[Node]:
+    def _parse_stream(self, source: bytes) -> list[Node]:
+        """Parse the top-level elements of the synthetic root as the XML stream completes them.
+
+        Element handlers work on whole subtrees, so each top-level element is dispatched on its
+        end event and cleared right away; its emptied shell is detached from the root once the
+        next sibling starts and its tail text is known. The XML tree held in memory is thereby
+        bounded by the largest top-level block rather than the whole document.
+
+        Because handlers run before the rest of the input has been read, a handler that fails on
+        an element first lets the stream finish, so malformed XML still surfaces as a ParseError.
+        """
+        nodes: list[Node] = []
+        stack: list[etree._Element] = []
+        previous: etree._Element | None = None
+
+        events = self._iter_events(source)
+        for event, element in events:
+            if event == "start":
+                if len(stack) == 1:
+                    root = stack[0]
+                    text = root.text if previous is None else previous.tail
+                    if text and (text := text.strip()):
+                        nodes.append(Text(text=text))
+                    if previous is not None:
+                        del root[0]
+                stack.append(element)
+                continue
+
+            stack.pop()
+            if len(stack) == 1:
+                try:
+                    node = self._parse_element(element)
+                except Exception:
+                    for _ in events:
+                        pass
+                    raise
+                if node:
+                    nodes.append(node)
+                element.clear(keep_tail=True)
+                previous = element
+            elif not stack:
+                text = element.text if previous is None else previous.tail
+                if text and (text := text.strip()):
+                    nodes.append(Text(text=text))
+
+        return nodes
+
+    def _iter_events(self, source: bytes) -> Iterator[tuple[str, etree._Element]]:
+        """Feed the source, wrapped in the synthetic root, to a pull parser and yield its events.
+
+        Each parse gets its own pull parser, so concurrent and nested parses never share state.
+        """
+        parser = etree.XMLPullParser(events=("start", "end"), remove_comments=True, remove_pis=True)
+
+        parser.feed(self._DOCUMENT_PROLOGUE)
+        for offset in range(0, len(source), _STREAM_CHUNK_SIZE):
+            parser.feed(source[offset : offset + _STREAM_CHUNK_SIZE])
+            yield from cast(Iterator[tuple[str, etree._Element]], parser.read_events())
+
+        parser.feed(self._DOCUMENT_EPILOGUE)
+        parser.close()
+        yield from cast(Iterator[tuple[str, etree._Element]], parser.read_events())
+
+    def _parse_children(self, element: etree._Element) -> list[Node]:
         """Parse all children of an element into nodes."""
         nodes: list[Node] = []
 
-        if element.text and element.text.strip():
-            nodes.append(Text(text=element.text.strip()))
+        text = element.text
+        if text and (text := text.strip()):
+            nodes.append(Text(text=text))
 
         for child in element:
             node = self._parse_element(child)
             if node:
                 nodes.append(node)
 
-            if child.tail and child.tail.strip():
-                nodes.append(Text(text=child.tail.strip()))
+            tail = child.tail
+            if tail and (tail := tail.strip()):
+                nodes.append(Text(text=tail))
 
         return nodes
 
-    def _parse_element(self, element: ET.Element) -> Node | None:
+    def _parse_element(self, element: etree._Element) -> Node | None:
         """Parse a single element into appropriate node type."""
         tag = self._get_tag_name(element)
 
         if tag in self._skipped_elements:
             return None
 
-        parser = self._element_parsers.get(tag)
-        if parser:
-            return parser(element)
+        handler = self._element_parsers.get(tag)
+        if handler:
+            return handler(self, element)
 
-        self.diagnostics.append(f"unknown_element:{tag}")
+        self._add_diagnostic(f"unknown_element:{tag}")
         return None
 
-    def _parse_layout(self, element: ET.Element) -> LayoutElement:
+    def _parse_layout(self, element: etree._Element) -> LayoutElement:
         """Parse ac:layout element."""
         return LayoutElement(children=self._parse_children(element))
 
-    def _parse_layout_section(self, element: ET.Element) -> LayoutSection:
+    def _parse_layout_section(self, element: etree._Element) -> LayoutSection:
         """Parse ac:layout-section element."""
         section_type_str = self._get_attr(element, "type") or "single"
         section_type = LayoutSectionType(section_type_str)
@@ -273,54 +458,51 @@ class ConfluenceParser:
             children=self._parse_children(element),
         )
 
-    def _parse_layout_cell(self, element: ET.Element) -> LayoutCell:
+    def _parse_layout_cell(self, element: etree._Element) -> LayoutCell:
         """Parse ac:layout-cell element."""
         return LayoutCell(children=self._parse_children(element))
 
-    def _parse_heading(self, element: ET.Element) -> HeadingElement:
+    def _parse_heading(self, element: etree._Element) -> HeadingElement:
         """Parse heading elements (h1, h2, h3, h4, h5, h6)."""
         tag = self._get_tag_name(element)
-        heading_type = HeadingType(tag)
+        heading_type = _HEADING_TYPES[tag]
         styles = self._parse_css_styles(element)
         return HeadingElement(type=heading_type, styles=styles, children=self._parse_children(element))
 
-    def _parse_text_effect(self, element: ET.Element) -> TextEffectElement:
+    def _parse_text_effect(self, element: etree._Element) -> TextEffectElement:
         """Parse text effect elements (strong, em, span, etc.)."""
         tag = self._get_tag_name(element)
-        effect_type = TextEffectType(tag)
+        effect_type = _TEXT_EFFECT_TYPES[tag]
 
         styles = self._parse_css_styles(element)
 
         return TextEffectElement(type=effect_type, styles=styles, children=self._parse_children(element))
 
-    def _parse_text_break(self, element: ET.Element) -> TextBreakElement:
-        """Parse text break elements (p, br, hr)."""
-        tag = self._get_tag_name(element)
-        break_type = TextBreakType(tag)
+    def _parse_paragraph(self, element: etree._Element) -> TextBreakElement:
+        """Parse p elements."""
+        styles = self._parse_css_styles(element)
+        return TextBreakElement(type=TextBreakType.PARAGRAPH, styles=styles, children=self._parse_children(element))
 
-        if break_type == TextBreakType.PARAGRAPH:
-            styles = self._parse_css_styles(element)
-            return TextBreakElement(type=break_type, styles=styles, children=self._parse_children(element))
-        else:
-            return TextBreakElement(type=break_type)
+    def _parse_line_break(self, element: etree._Element) -> TextBreakElement:
+        """Parse br elements; they are always empty, so nothing below them is inspected."""
+        return TextBreakElement(type=TextBreakType.LINE_BREAK)
+
+    def _parse_horizontal_rule(self, element: etree._Element) -> TextBreakElement:
+        """Parse hr elements; they are always empty, so nothing below them is inspected."""
+        return TextBreakElement(type=TextBreakType.HORIZONTAL_RULE)
 
-    def _parse_list(self, element: ET.Element) -> ListElement:
+    def _parse_list(self, element: etree._Element) -> ListElement:
         """Parse list elements (ul, ol, task-list)."""
         tag = self._get_tag_name(element)
-        list_type = ListType(tag)
+        list_type = _LIST_TYPES[tag]
 
         start = None
         if list_type == ListType.ORDERED:
-            start_attr = self._get_attr(element, "start")
-            if start_attr:
-                try:
-                    start = int(start_attr)
-                except ValueError:
-                    pass
+            start = _parse_int(self._get_attr(element, "start"))
 
         return ListElement(type=list_type, start=start, children=self._parse_children(element))
 
-    def _parse_list_item(self, element: ET.Element) -> ListItem:
+    def _parse_list_item(self, element: etree._Element) -> ListItem:
         """Parse list item elements (li, ac:task)."""
         tag = self._get_tag_name(element)
 
@@ -332,7 +514,9 @@ class ConfluenceParser:
 
             for child in element:
                 child_tag = self._get_tag_name(child)
-                if child_tag == "task-id":
+                if child_tag in self._skipped_elements:
+                    continue
+                elif child_tag == "task-id":
                     task_id = self._extract_text_content(child)
                 elif child_tag == "task-uuid":
                     uuid = self._extract_text_content(child)
@@ -346,7 +530,7 @@ class ConfluenceParser:
         else:
             return ListItem(children=self._parse_children(element))
 
-    def _parse_external_link(self, element: ET.Element) -> LinkElement:
+    def _parse_external_link(self, element: etree._Element) -> LinkElement:
         """Parse external <a> links."""
         href = self._get_attr(element, "href")
 
@@ -357,52 +541,33 @@ class ConfluenceParser:
 
         return LinkElement(type=link_type, href=href, children=self._parse_children(element))
 
-    def _parse_link(self, element: ET.Element) -> LinkElement:
+    def _parse_link(self, element: etree._Element) -> LinkElement:
         """Parse ac:link elements."""
         anchor = self._get_attr(element, "anchor")
 
         children = self._parse_children(element)
 
-        link_type = LinkType.EXTERNAL
+        # The link's ri:* child decides both its type and the reference fields copied onto it
+        identifier = next((child for child in children if isinstance(child, ResourceIdentifier)), None)
         if anchor:
             link_type = LinkType.ANCHOR
+        elif identifier is not None:
+            link_type = _RESOURCE_LINK_TYPES.get(identifier.type, LinkType.EXTERNAL)
         else:
-            for child in children:
-                if hasattr(child, "type") and hasattr(child.type, "value"):
-                    if child.type.value == "page":
-                        link_type = LinkType.PAGE
-                        break
-                    elif child.type.value == "blog-post":
-                        link_type = LinkType.BLOG_POST
-                        break
-                    elif child.type.value == "user":
-                        link_type = LinkType.USER
-                        break
-                    elif child.type.value == "space":
-                        link_type = LinkType.SPACE
-                        break
-                    elif child.type.value == "attachment":
-                        link_type = LinkType.ATTACHMENT
-                        break
-
-        return LinkElement(type=link_type, anchor=anchor, children=children)
-
-    def _parse_link_body(self, element: ET.Element) -> Fragment:
+            link_type = LinkType.EXTERNAL
+
+        resource_fields = {name: getattr(identifier, name) for name in _LINK_RESOURCE_FIELDS} if identifier else {}
+
+        return LinkElement(type=link_type, anchor=anchor, children=children, **resource_fields)
+
+    def _parse_link_body(self, element: etree._Element) -> Fragment:
         """Parse ac:link-body elements as fragment containers for rich content."""
         return Fragment(children=self._parse_children(element))
 
-    def _parse_image(self, element: ET.Element) -> Image:
+    def _parse_image(self, element: etree._Element) -> Image:
         """Parse ac:image elements."""
-        src = self._get_attr(element, "src")
-        alt = self._get_attr(element, "alt")
-        title = self._get_attr(element, "title")
-        width = self._get_attr(element, "width")
-        height = self._get_attr(element, "height")
-        alignment = self._get_attr(element, "align")
-        layout = self._get_attr(element, "layout")
-        original_height = self._get_attr(element, "original-height")
-        original_width = self._get_attr(element, "original-width")
-        custom_width = self._get_attr(element, "custom-width")
+        fields = self._collect_attributes(element, self._image_attribute_keys)
+        custom_width = fields.pop("custom_width", None)
 
         filename = None
         version_at_save = None
@@ -412,7 +577,9 @@ class ConfluenceParser:
         for child in element:
             child_tag = self._get_tag_name(child)
 
-            if child_tag == "attachment":
+            if child_tag in self._skipped_elements:
+                continue
+            elif child_tag == "attachment":
                 filename = self._get_attr(child, "filename")
                 version_at_save = self._get_attr(child, "version-at-save")
             elif child_tag == "url":
@@ -421,23 +588,15 @@ class ConfluenceParser:
                 children = self._parse_children(child)
 
         return Image(
-            src=src,
-            alt=alt,
-            title=title,
-            width=width,
-            height=height,
-            alignment=alignment,
-            layout=layout,
-            original_height=original_height,
-            original_width=original_width,
-            custom_width=custom_width == "true" if custom_width else None,
+            **fields,
+            custom_width=_parse_bool(custom_width) if custom_width else None,
             filename=filename,
             version_at_save=version_at_save,
             url_value=url_value,
             children=children,
         )
 
-    def _parse_emoticon(self, element: ET.Element) -> Emoticon:
+    def _parse_emoticon(self, element: etree._Element) -> Emoticon:
         """Parse ac:emoticon elements."""
         name = self._get_attr(element, "name")
         emoji_shortname = self._get_attr(element, "emoji-shortname")
@@ -448,52 +607,25 @@ class ConfluenceParser:
             name=name or "", emoji_shortname=emoji_shortname, emoji_id=emoji_id, emoji_fallback=emoji_fallback
         )
 
-    def _parse_placeholder(self, element: ET.Element) -> PlaceholderElement:
+    def _parse_placeholder(self, element: etree._Element) -> PlaceholderElement:
         """Parse placeholder elements."""
         text = self._extract_text_content(element)
         return PlaceholderElement(text=text)
 
-    def _parse_time(self, element: ET.Element) -> Time:
+    def _parse_time(self, element: etree._Element) -> Time:
         """Parse time elements."""
         datetime = self._get_attr(element, "datetime")
         return Time(datetime=datetime)
 
-    def _parse_resource_identifier(self, element: ET.Element) -> ResourceIdentifier:
+    def _parse_resource_identifier(self, element: etree._Element) -> ResourceIdentifier:
         """Parse ri:* resource identifier elements."""
         tag = self._get_tag_name(element)
-        resource_type = ResourceIdentifierType(tag)
-
-        space_key = self._get_attr(element, "space-key")
-        content_title = self._get_attr(element, "content-title")
-        content_id = self._get_attr(element, "content-id")
-
-        posting_day = self._get_attr(element, "posting-day")
-        filename = self._get_attr(element, "filename")
-        value = self._get_attr(element, "value")
-        key = self._get_attr(element, "key")
-        parameter = self._get_attr(element, "parameter")
-        account_id = self._get_attr(element, "account-id")
-        local_id = self._get_attr(element, "local-id")
-        userkey = self._get_attr(element, "userkey")
-        version_at_save = self._get_attr(element, "version-at-save")
+        resource_type = _RESOURCE_IDENTIFIER_TYPES[tag]
 
-        return ResourceIdentifier(
-            type=resource_type,
-            space_key=space_key,
-            content_title=content_title,
-            content_id=content_id,
-            posting_day=posting_day,
-            filename=filename,
-            value=value,
-            key=key,
-            parameter=parameter,
-            account_id=account_id,
-            local_id=local_id,
-            userkey=userkey,
-            version_at_save=version_at_save,
-        )
+        fields = self._collect_attributes(element, self._resource_identifier_keys)
+        return ResourceIdentifier(type=resource_type, **fields)
 
-    def _parse_table(self, element: ET.Element) -> Table:
+    def _parse_table(self, element: etree._Element) -> Table:
         """Parse table elements."""
         width = self._get_attr(element, "data-table-width")
         layout = self._get_attr(element, "data-layout")
@@ -508,15 +640,15 @@ class ConfluenceParser:
             children=self._parse_children(element),
         )
 
-    def _parse_table_body(self, element: ET.Element) -> Fragment:
+    def _parse_table_body(self, element: etree._Element) -> Fragment:
         """Parse tbody elements as fragment containers."""
         return Fragment(children=self._parse_children(element))
 
-    def _parse_table_row(self, element: ET.Element) -> TableRow:
+    def _parse_table_row(self, element: etree._Element) -> TableRow:
         """Parse tr elements."""
         return TableRow(children=self._parse_children(element))
 
-    def _parse_table_cell(self, element: ET.Element) -> TableCell:
+    def _parse_table_cell(self, element: etree._Element) -> TableCell:
         """Parse th/td elements."""
         tag = self._get_tag_name(element)
         rowspan = self._get_attr(element, "rowspan")
@@ -525,202 +657,124 @@ class ConfluenceParser:
 
         return TableCell(
             is_header=tag == "th",
-            rowspan=int(rowspan) if rowspan else None,
-            colspan=int(colspan) if colspan else None,
+            rowspan=_parse_int(rowspan),
+            colspan=_parse_int(colspan),
             styles=styles,
             children=self._parse_children(element),
         )
 
-    def _parse_macro(self, element: ET.Element) -> Node | None:
+    def _parse_macro(self, element: etree._Element) -> Node | None:
         """Parse simple macros by dispatching to specific handlers."""
         name = self._get_attr(element, "name") or ""
-        parser = self._macro_parsers.get(name)
+        handler = self._macro_parsers.get(name)
 
-        if parser:
-            return parser(element)
+        if handler:
+            return handler(self, element)
 
-        self.diagnostics.append(f"unknown_macro:{name}")
+        self._add_diagnostic(f"unknown_macro:{name}")
         return None
 
-    def _parse_structured_macro(self, element: ET.Element) -> Node | None:
+    def _parse_structured_macro(self, element: etree._Element) -> Node | None:
         """Parse structured macros by dispatching to specific handlers."""
         name = self._get_attr(element, "name") or ""
-        parser = self._macro_parsers.get(name)
+        handler = self._macro_parsers.get(name)
 
-        if parser:
-            return parser(element)
+        if handler:
+            return handler(self, element)
 
-        self.diagnostics.append(f"unknown_macro:{name}")
+        self._add_diagnostic(f"unknown_macro:{name}")
         return None
 
-    def _parse_adf_extension(self, element: ET.Element) -> Node | None:
+    def _parse_adf_extension(self, element: etree._Element) -> Node | None:
         """Parse ADF extension elements that can contain various types of content."""
         adf_node = self._find_child_by_tag(element, "adf-node")
         if adf_node is None:
             return None
 
         node_type = self._get_attr(adf_node, "type")
+        handler = self._adf_node_parsers.get(node_type or "")
+        if handler:
+            return handler(self, adf_node)
 
-        if node_type == "panel":
-            return self._parse_adf_panel(adf_node)
-        elif node_type == "decision-list":
-            return self._parse_adf_decision_list(adf_node)
-        elif node_type == "decision-item":
-            return self._parse_adf_decision_item(adf_node)
-
-        self.diagnostics.append(f"unknown_adf_node_type:{node_type}")
+        self._add_diagnostic(f"unknown_adf_node_type:{node_type}")
         return None
 
-    def _parse_adf_panel(self, adf_node: ET.Element) -> PanelMacro:
+    def _parse_adf_panel(self, adf_node: etree._Element) -> PanelMacro:
         """Parse ADF panel node into PanelMacro."""
-        panel_type_name = "panel"
-        bg_color = None
-
-        for attr_elem in adf_node:
-            if self._get_tag_name(attr_elem) == "adf-attribute":
-                key = self._get_attr(attr_elem, "key")
-                value = self._extract_text_content(attr_elem)
-
-                if key == "panel-type":
-                    panel_type_name = value
-                elif key == "bg-color" or key == "bgColor":
-                    bg_color = value
-
-        if panel_type_name == "note":
-            panel_type = PanelMacroType.NOTE
-        else:
-            panel_type = PanelMacroType.PANEL
-
-        children = []
-        adf_content = self._find_child_by_tag(adf_node, "adf-content")
-        if adf_content is not None:
-            children = self._parse_children(adf_content)
+        index = self._index_children(adf_node)
+        attributes = self._get_adf_attributes(index.get("adf-attribute", []))
+        panel_type = _ADF_PANEL_TYPES.get(attributes.get("panel-type", "panel"), PanelMacroType.PANEL)
+        contents = index.get("adf-content")
+        children = self._parse_children(contents[0]) if contents else []
 
         return PanelMacro(
             type=panel_type,
-            bg_color=bg_color,
+            bg_color=attributes.get("bg-color"),
             panel_icon=None,
             panel_icon_id=None,
             panel_icon_text=None,
             children=children,
         )
 
-    def _parse_adf_decision_list(self, adf_node: ET.Element) -> DecisionList:
+    def _parse_adf_decision_list(self, adf_node: etree._Element) -> DecisionList:
         """Parse ADF decision-list node into DecisionList."""
-        local_id = None
-
-        for attr_elem in adf_node:
-            if self._get_tag_name(attr_elem) == "adf-attribute":
-                key = self._get_attr(attr_elem, "key")
-                value = self._extract_text_content(attr_elem)
-
-                if key == "local-id":
-                    local_id = value
-
-        children = []
-        for child in adf_node:
-            if self._get_tag_name(child) == "adf-node":
-                decision_item = self._parse_adf_decision_item(child)
-                if decision_item:
-                    children.append(decision_item)
+        index = self._index_children(adf_node)
+        attributes = self._get_adf_attributes(index.get("adf-attribute", []))
+        children = [self._parse_adf_decision_item(child) for child in index.get("adf-node", [])]
 
-        return DecisionList(local_id=local_id, children=children)
+        return DecisionList(local_id=attributes.get("local-id"), children=children)
 
-    def _parse_adf_decision_item(self, adf_node: ET.Element) -> DecisionListItem:
+    def _parse_adf_decision_item(self, adf_node: etree._Element) -> DecisionListItem:
         """Parse ADF decision-item node into DecisionListItem."""
-        local_id = None
-        state = None
-
-        for attr_elem in adf_node:
-            if self._get_tag_name(attr_elem) == "adf-attribute":
-                key = self._get_attr(attr_elem, "key")
-                value = self._extract_text_content(attr_elem)
-
-                if key == "local-id":
-                    local_id = value
-                elif key == "state":
-                    if value in ["DECIDED", "PENDING"]:
-                        state = DecisionListItemState(value)
-
-        children = []
-        adf_content = self._find_child_by_tag(adf_node, "adf-content")
-        if adf_content is not None:
-            children = self._parse_children(adf_content)
-
-        return DecisionListItem(local_id=local_id, state=state, children=children)
+        index = self._index_children(adf_node)
+        attributes = self._get_adf_attributes(index.get("adf-attribute", []))
+        contents = index.get("adf-content")
+        children = self._parse_children(contents[0]) if contents else []
+
+        return DecisionListItem(
+            local_id=attributes.get("local-id"),
+            state=_DECISION_STATES.get(attributes.get("state", "")),
+            children=children,
+        )
 
-    def _parse_panel_macro(self, element: ET.Element) -> PanelMacro:
+    def _parse_panel_macro(self, element: etree._Element) -> PanelMacro:
         """Parse panel macro elements (panel, tip, note, warning, info)."""
         name = self._get_attr(element, "name") or ""
+        panel_type = _PANEL_MACRO_TYPES.get(name, PanelMacroType.PANEL)
 
-        if name == "tip":
-            panel_type = PanelMacroType.SUCCESS
-        elif name == "note":
-            panel_type = PanelMacroType.WARNING
-        elif name == "warning":
-            panel_type = PanelMacroType.ERROR
-        elif name == "info":
-            panel_type = PanelMacroType.INFO
-        else:
-            panel_type = PanelMacroType.PANEL
-
-        bg_color = None
-        panel_icon = None
-        panel_icon_id = None
-        panel_icon_text = None
-
-        for param in self._iter_parameters(element):
-            param_name = self._get_attr(param, "name")
-            param_value = self._extract_text_content(param)
-
-            if param_name == "bgColor":
-                bg_color = param_value
-            elif param_name == "panelIcon":
-                panel_icon = param_value
-            elif param_name == "panelIconId":
-                panel_icon_id = param_value
-            elif param_name == "panelIconText":
-                panel_icon_text = param_value
-
-        children = []
-        rich_text_body = self._find_child_by_tag(element, "rich-text-body")
-        if rich_text_body is not None:
-            children = self._parse_children(rich_text_body)
+        index = self._index_children(element)
+        params = self._get_parameter_values(
+            element, "bgColor", "panelIcon", "panelIconId", "panelIconText", parameters=index.get("parameter", [])
+        )
+        bodies = index.get("rich-text-body")
+        children = self._parse_children(bodies[0]) if bodies else []
 
         return PanelMacro(
             type=panel_type,
-            bg_color=bg_color,
-            panel_icon=panel_icon,
-            panel_icon_id=panel_icon_id,
-            panel_icon_text=panel_icon_text,
+            bg_color=params.get("bgColor"),
+            panel_icon=params.get("panelIcon"),
+            panel_icon_id=params.get("panelIconId"),
+            panel_icon_text=params.get("panelIconText"),
             children=children,
         )
 
-    def _parse_code_macro(self, element: ET.Element) -> CodeMacro:
+    def _parse_code_macro(self, element: etree._Element) -> CodeMacro:
         """Parse code macro elements."""
-        language = None
-        breakout_mode = None
-        breakout_width = None
-
-        for param in self._iter_parameters(element):
-            param_name = self._get_attr(param, "name")
-            param_value = self._extract_text_content(param)
-
-            if param_name == "language":
-                language = param_value
-            elif param_name == "breakoutMode":
-                breakout_mode = param_value
-            elif param_name == "breakoutWidth":
-                breakout_width = param_value
-
-        code = ""
-        plain_text_body = self._find_child_by_tag(element, "plain-text-body")
-        if plain_text_body is not None:
-            code = self._extract_text_content(plain_text_body)
-
-        return CodeMacro(language=language, breakout_mode=breakout_mode, breakout_width=breakout_width, code=code)
+        index = self._index_children(element)
+        params = self._get_parameter_values(
+            element, "language", "breakoutMode", "breakoutWidth", parameters=index.get("parameter", [])
+        )
+        bodies = index.get("plain-text-body")
+        code = self._extract_text_content(bodies[0]) if bodies else ""
+
+        return CodeMacro(
+            language=params.get("language"),
+            breakout_mode=params.get("breakoutMode"),
+            breakout_width=params.get("breakoutWidth"),
+            code=code,
+        )
 
-    def _parse_details_macro(self, element: ET.Element) -> DetailsMacro:
+    def _parse_details_macro(self, element: etree._Element) -> DetailsMacro:
         """Parse details macro elements."""
         children = []
         rich_text_body = self._find_child_by_tag(element, "rich-text-body")
@@ -729,76 +783,31 @@ class ConfluenceParser:
 
         return DetailsMacro(children=children)
 
-    def _parse_expand_macro(self, element: ET.Element) -> ExpandMacro:
+    def _parse_expand_macro(self, element: etree._Element) -> ExpandMacro:
         """Parse expand macro elements."""
-        title = None
-        breakout_width = None
-
-        for param in self._iter_parameters(element):
-            param_name = self._get_attr(param, "name")
-            param_value = self._extract_text_content(param)
-
-            if param_name == "title":
-                title = param_value
-            elif param_name == "breakoutWidth":
-                breakout_width = param_value
-
-        children = []
-        rich_text_body = self._find_child_by_tag(element, "rich-text-body")
-        if rich_text_body is not None:
-            children = self._parse_children(rich_text_body)
+        index = self._index_children(element)
+        params = self._get_parameter_values(element, "title", "breakoutWidth", parameters=index.get("parameter", []))
+        bodies = index.get("rich-text-body")
+        children = self._parse_children(bodies[0]) if bodies else []
 
-        return ExpandMacro(title=title, breakout_width=breakout_width, children=children)
+        return ExpandMacro(title=params.get("title"), breakout_width=params.get("breakoutWidth"), children=children)
 
-    def _parse_status_macro(self, element: ET.Element) -> StatusMacro:
+    def _parse_status_macro(self, element: etree._Element) -> StatusMacro:
         """Parse status macro elements."""
-        title = None
-        colour = None
-
-        for param in self._iter_parameters(element):
-            param_name = self._get_attr(param, "name")
-            param_value = self._extract_text_content(param)
-
-            if param_name == "title":
-                title = param_value
-            elif param_name == "colour":
-                colour = param_value
-
-        return StatusMacro(title=title, colour=colour)
+        params = self._get_parameter_values(element, "title", "colour")
+        return StatusMacro(title=params.get("title"), colour=params.get("colour"))
 
-    def _parse_toc_macro(self, element: ET.Element) -> TocMacro:
+    def _parse_toc_macro(self, element: etree._Element) -> TocMacro:
         """Parse table of contents macro elements."""
-        style = None
-
-        for param in self._iter_parameters(element):
-            param_name = self._get_attr(param, "name")
-            param_value = self._extract_text_content(param)
-
-            if param_name == "style":
-                style = param_value
-
-        return TocMacro(style=style)
+        params = self._get_parameter_values(element, "style")
+        return TocMacro(style=params.get("style"))
 
-    def _parse_jira_macro(self, element: ET.Element) -> JiraMacro:
+    def _parse_jira_macro(self, element: etree._Element) -> JiraMacro:
         """Parse JIRA macro elements."""
-        key = None
-        server_id = None
-        server = None
+        params = self._get_parameter_values(element, "key", "serverId", "server")
+        return JiraMacro(key=params.get("key"), server_id=params.get("serverId"), server=params.get("server"))
 
-        for param in self._iter_parameters(element):
-            param_name = self._get_attr(param, "name")
-            param_value = self._extract_text_content(param)
-
-            if param_name == "key":
-                key = param_value
-            elif param_name == "serverId":
-                server_id = param_value
-            elif param_name == "server":
-                server = param_value
-
-        return JiraMacro(key=key, server_id=server_id, server=server)
-
-    def _parse_include_macro(self, element: ET.Element) -> IncludeMacro:
+    def _parse_include_macro(self, element: etree._Element) -> IncludeMacro:
         """Parse include macro elements."""
         children = []
         space_key = None
@@ -821,23 +830,15 @@ class ConfluenceParser:
             space_key=space_key, content_title=content_title, version_at_save=version_at_save, children=children
         )
 
-    def _parse_tasks_report_macro(self, element: ET.Element) -> TasksReportMacro:
+    def _parse_tasks_report_macro(self, element: etree._Element) -> TasksReportMacro:
         """Parse tasks-report-macro elements."""
-        spaces = None
-        is_missing_required_parameters = False
-
-        for param in self._iter_parameters(element):
-            param_name = self._get_attr(param, "name")
-            param_value = self._extract_text_content(param)
-
-            if param_name == "spaces":
-                spaces = param_value
-            elif param_name == "isMissingRequiredParameters":
-                is_missing_required_parameters = param_value.lower() == "true"
-
-        return TasksReportMacro(spaces=spaces, is_missing_required_parameters=is_missing_required_parameters)
+        params = self._get_parameter_values(element, "spaces", "isMissingRequiredParameters")
+        return TasksReportMacro(
+            spaces=params.get("spaces"),
+            is_missing_required_parameters=_parse_bool(params.get("isMissingRequiredParameters")),
+        )
 
-    def _parse_excerpt_include_macro(self, element: ET.Element) -> ExcerptIncludeMacro:
+    def _parse_excerpt_include_macro(self, element: etree._Element) -> ExcerptIncludeMacro:
         """Parse excerpt-include macro elements."""
         children = []
         space_key = None
@@ -867,11 +868,11 @@ class ConfluenceParser:
             children=children,
         )
 
-    def _parse_attachments_macro(self, element: ET.Element) -> AttachmentsMacro:
+    def _parse_attachments_macro(self, element: etree._Element) -> AttachmentsMacro:
         """Parse attachments macro elements."""
         return AttachmentsMacro()
 
-    def _parse_viewpdf_macro(self, element: ET.Element) -> ViewPdfMacro:
+    def _parse_viewpdf_macro(self, element: etree._Element) -> ViewPdfMacro:
         """Parse viewpdf macro elements."""
         filename = None
         version_at_save = None
@@ -886,7 +887,7 @@ class ConfluenceParser:
 
         return ViewPdfMacro(filename=filename, version_at_save=version_at_save)
 
-    def _parse_view_file_macro(self, element: ET.Element) -> ViewFileMacro:
+    def _parse_view_file_macro(self, element: etree._Element) -> ViewFileMacro:
         """Parse view-file macro elements."""
         filename = None
         version_at_save = None
@@ -901,7 +902,7 @@ class ConfluenceParser:
 
         return ViewFileMacro(filename=filename, version_at_save=version_at_save)
 
-    def _parse_profile_macro(self, element: ET.Element) -> ProfileMacro:
+    def _parse_profile_macro(self, element: etree._Element) -> ProfileMacro:
         """Parse profile macro elements."""
         children = []
         account_id = None
@@ -916,20 +917,12 @@ class ConfluenceParser:
 
         return ProfileMacro(account_id=account_id, children=children)
 
-    def _parse_anchor_macro(self, element: ET.Element) -> AnchorMacro:
+    def _parse_anchor_macro(self, element: etree._Element) -> AnchorMacro:
         """Parse anchor macro elements."""
-        anchor_name = None
-
-        for param in self._iter_parameters(element):
-            param_name = self._get_attr(param, "name")
-            param_value = self._extract_text_content(param)
-
-            if param_name == "":
-                anchor_name = param_value
-
-        return AnchorMacro(anchor_name=anchor_name)
+        params = self._get_parameter_values(element, "")
+        return AnchorMacro(anchor_name=params.get(""))
 
-    def _parse_excerpt_macro(self, element: ET.Element) -> ExcerptMacro:
+    def _parse_excerpt_macro(self, element: etree._Element) -> ExcerptMacro:
         """Parse excerpt macro elements."""
         children = []
         rich_text_body = self._find_child_by_tag(element, "rich-text-body")
@@ -938,63 +931,199 @@ class ConfluenceParser:
 
         return ExcerptMacro(children=children)
 
-    def _get_tag_name(self, element: ET.Element) -> str:
+    def _collect_attributes(self, element: etree._Element, keys: dict[str, tuple[str, int]]) -> dict[str, str]:
+        """Map an element's attributes to fields in one pass over them.
+
+        When a field is spelled several ways on the same element, the lowest-ranked spelling wins,
+        as it would with one _get_attr call per field.
+        """
+        fields: dict[str, str] = {}
+        ranks: dict[str, int] = {}
+        for key, value in element.attrib.items():
+            entry = keys.get(key)
+            if entry is not None:
+                field, rank = entry
+                if rank < ranks.get(field, rank + 1):
+                    fields[field] = value
+                    ranks[field] = rank
+        return fields
+
+    def _get_tag_name(self, element: etree._Element) -> str:
         """Extract tag name without namespace prefix."""
-        tag = element.tag
-        return tag.split("}", 1)[1] if "}" in tag else tag
+        return _strip_namespace(cast(str, element.tag))
 
-    def _get_attr(self, element: ET.Element, attr_name: str) -> str | None:
+    def _get_attr(self, element: etree._Element, attr_name: str) -> str | None:
         """Get attribute value handling multiple namespace variants."""
-        value = element.attrib.get(attr_name)
+        value = element.get(attr_name)
         if value is not None:
             return value
 
-        for ns in [self.NS_AC, self.NS_RI, self.NS_AT]:
-            value = element.attrib.get(f"{{{ns}}}{attr_name}")
+        qualified_keys = self._qualified_attribute_keys.get(attr_name)
+        if qualified_keys is None:
+            qualified_keys = self._qualified_attribute_keys[attr_name] = tuple(
+                f"{{{ns}}}{attr_name}" for ns in (self.NS_AC, self.NS_RI, self.NS_AT)
+            )
+
+        for key in qualified_keys:
+            value = element.get(key)
             if value is not None:
                 return value
 
         return None
 
-    def _find_child_by_tag(self, element: ET.Element, tag_name: str) -> ET.Element | None:
-        """Find first direct child with given tag name."""
+    def _find_child_by_tag(self, element: etree._Element, tag_name: str) -> etree._Element | None:
+        """Find first direct child with given tag name; skipped elements are never found."""
+        if tag_name in self._skipped_elements:
+            return None
         for child in element:
             if self._get_tag_name(child) == tag_name:
                 return child
         return None
 
-    def _extract_text_content(self, element: ET.Element) -> str:
+    def _extract_text_content(self, element: etree._Element) -> str:
         """Extract all text content from element and descendants."""
-        parts: list[str] = []
-
-        if element.text:
-            parts.append(element.text)
+        # Parameters and plain-text bodies (CDATA code) are leaves: their text is the whole content
+        if len(element) == 0:
+            return element.text or ""
 
-        for child in element:
-            parts.append(self._extract_text_content(child))
-            if child.tail:
-                parts.append(child.tail)
-
-        return "".join(parts)
+        return "".join(element.itertext())
 
-    def _iter_parameters(self, element: ET.Element) -> Iterator[ET.Element]:
-        """Iterate over parameter children of a macro element."""
+    def _iter_parameters(self, element: etree._Element) -> Iterator[etree._Element]:
+        """Iterate over parameter children of a macro element, unless parameters are skipped."""
+        if "parameter" in self._skipped_elements:
+            return
         for child in element:
             if self._get_tag_name(child) == "parameter":
                 yield child
 
-    def _parse_css_styles(self, element: ET.Element) -> dict[str, str]:
-        """Parse all CSS styles from element's style attribute."""
-        style_attr = self._get_attr(element, "style") or ""
-        styles = {}
-
-        for declaration in style_attr.split(";"):
-            if ":" in declaration:
-                prop, value = declaration.split(":", 1)
-                prop = prop.strip().lower()
-                value = value.strip()
-
-                if prop and value:
-                    styles[prop] = value
+    def _index_children(self, element: etree._Element) -> dict[str, list[etree._Element]]:
+        """Group direct children by local tag name in one pass, keeping document order.
 
-        return styles
+        Skipped elements are left out, so handlers never see them.
+        """
+        index: dict[str, list[etree._Element]] = {}
+        skipped = self._skipped_elements
+        for child in element:
+            tag = self._get_tag_name(child)
+            if tag not in skipped:
+                index.setdefault(tag, []).append(child)
+        return index
+
+    def _get_parameter_values(
+        self, element: etree._Element, *names: str, parameters: Iterable[etree._Element] | None = None
+    ) -> dict[str, str]:
+        """Collect the text of the named macro parameters; other parameters are never extracted.
+
+        Handlers that already indexed the macro's children pass its parameters to avoid a rescan.
+        """
+        values = {}
+        for param in self._iter_parameters(element) if parameters is None else parameters:
+            # Same precedence as _get_attr: the bare name, then ac:name, then the other namespaces
+            param_name = param.get("name")
+            if param_name is None:
+                param_name = param.get(self._AC_NAME)
+            if param_name is None:
+                param_name = self._get_attr(param, "name")
+            if param_name in names:
+                values[param_name] = self._extract_text_content(param)
+        return values
+
+    def _get_adf_attributes(self, attributes: Iterable[etree._Element]) -> dict[str, str]:
+        """Map the keys of ADF attribute elements to their text, in one pass over the attributes."""
+        values = {}
+        for attribute in attributes:
+            key = self._get_attr(attribute, "key")
+            if key is not None:
+                values[_ADF_ATTRIBUTE_ALIASES.get(key, key)] = self._extract_text_content(attribute)
+        return values
+
+    def _parse_css_styles(self, element: etree._Element) -> dict[str, str]:
+        """Parse all CSS styles from element's style attribute."""
+        style_attr = self._get_attr(element, "style")
+        return dict(_parse_style_declarations(style_attr)) if style_attr else {}
+
+    # Read-only dispatch tables of handler functions, built once per class; called as handler(self, element)
+    _element_parsers: ClassVar[Mapping[str, _Handler]] = MappingProxyType(
+        {
+            "macro": _parse_macro,
+            "structured-macro": _parse_structured_macro,
+            "layout": _parse_layout,
+            "layout-section": _parse_layout_section,
+            "layout-cell": _parse_layout_cell,
+            "h1": _parse_heading,
+            "h2": _parse_heading,
+            "h3": _parse_heading,
+            "h4": _parse_heading,
+            "h5": _parse_heading,
+            "h6": _parse_heading,
+            "strong": _parse_text_effect,
+            "em": _parse_text_effect,
+            "u": _parse_text_effect,
+            "del": _parse_text_effect,
+            "code": _parse_text_effect,
+            "sub": _parse_text_effect,
+            "sup": _parse_text_effect,
+            "blockquote": _parse_text_effect,
+            "span": _parse_text_effect,
+            "p": _parse_paragraph,
+            "br": _parse_line_break,
+            "hr": _parse_horizontal_rule,
+            "ul": _parse_list,
+            "ol": _parse_list,
+            "li": _parse_list_item,
+            "task-list": _parse_list,
+            "task": _parse_list_item,
+            "link": _parse_link,
+            "link-body": _parse_link_body,
+            "a": _parse_external_link,
+            "image": _parse_image,
+            "emoticon": _parse_emoticon,
+            "placeholder": _parse_placeholder,
+            "time": _parse_time,
+            "page": _parse_resource_identifier,
+            "blog-post": _parse_resource_identifier,
+            "attachment": _parse_resource_identifier,
+            "url": _parse_resource_identifier,
+            "shortcut": _parse_resource_identifier,
+            "user": _parse_resource_identifier,
+            "space": _parse_resource_identifier,
+            "content-entity": _parse_resource_identifier,
+            "table": _parse_table,
+            "tbody": _parse_table_body,
+            "tr": _parse_table_row,
+            "th": _parse_table_cell,
+            "td": _parse_table_cell,
+            "adf-extension": _parse_adf_extension,
+        }
+    )
+    _macro_parsers: ClassVar[Mapping[str, _Handler]] = MappingProxyType(
+        {
+            "panel": _parse_panel_macro,
+            "tip": _parse_panel_macro,
+            "note": _parse_panel_macro,
+            "warning": _parse_panel_macro,
+            "info": _parse_panel_macro,
+            "code": _parse_code_macro,
+            "details": _parse_details_macro,
+            "expand": _parse_expand_macro,
+            "status": _parse_status_macro,
+            "toc": _parse_toc_macro,
+            "jira": _parse_jira_macro,
+            "include": _parse_include_macro,
+            "tasks-report-macro": _parse_tasks_report_macro,
+            "excerpt-include": _parse_excerpt_include_macro,
+            "attachments": _parse_attachments_macro,
+            "viewpdf": _parse_viewpdf_macro,
+            "view-file": _parse_view_file_macro,
+            "profile": _parse_profile_macro,
+            "anchor": _parse_anchor_macro,
+            "excerpt": _parse_excerpt_macro,
+        }
+    )
+    _adf_node_parsers: ClassVar[Mapping[str, _Handler]] = MappingProxyType(
+        {
+            "panel": _parse_adf_panel,
+            "decision-list": _parse_adf_decision_list,
+            "decision-item": _parse_adf_decision_item,
+        }
+    )
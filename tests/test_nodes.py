@@ -89,6 +89,19 @@ class TestNodeBasics:
         assert len(containers) == 1
         assert len(headings) == 0
 
+    def test_node_walk_preorder_and_deep_nesting(self):
+        """Test walk yields nodes in document order and handles deeply nested trees."""
+        first = Text(text="first")
+        inner = ContainerElement(children=[Text(text="inner")])
+        container = ContainerElement(children=[first, inner, Text(text="last")])
+        assert [node.to_text() for node in container.walk() if isinstance(node, Text)] == ["first", "inner", "last"]
+        assert list(container.walk())[:3] == [container, first, inner]
+
+        deep: Node = Text(text="leaf")
+        for _ in range(5000):
+            deep = ContainerElement(children=[deep])
+        assert len(deep.find_all()) == 5001
+
     def test_container_element_basics(self):
         """Test container element basic functionality."""
         container = ContainerElement()
@@ -898,6 +911,21 @@ class TestMacroElements:
         assert len(codes) == 1
         assert codes[0].language == "python"
 
+    def test_code_macro_cdata_body(self):
+        """Test code macro CDATA bodies are kept verbatim."""
+        parser = ConfluenceParser()
+        code = 'if a < b && c > d:\n    print("<p>&amp;</p>")\n'
+        content = f"""
+        <ac:structured-macro ac:name="code">
+            <ac:plain-text-body><![CDATA[{code}]]></ac:plain-text-body>
+        </ac:structured-macro>
+        """
+        doc = parser.parse(content)
+
+        codes = doc.find_all(CodeMacro)
+        assert len(codes) == 1
+        assert codes[0].code == code
+
     def test_expand_macro(self):
         """Test expand macro."""
         parser = ConfluenceParser()
@@ -26,7 +26,9 @@ from confluence_content_parser import (
     ParsingError,
     ProfileMacro,
     ResourceIdentifier,
+    TableCell,
     TasksReportMacro,
+    Text,
     TextBreakElement,
     TextBreakType,
 )
@@ -50,6 +52,92 @@ class TestConfluenceParser:
         assert parser.raise_on_finish is False
         assert parser.diagnostics == []
 
+    def test_parse_bytes(self):
+        """Test parsing UTF-8 bytes matches parsing the decoded string."""
+        parser = ConfluenceParser()
+        content = "<p>Caf\u00e9 <strong>cr\u00e8me</strong>&nbsp;br\u00fbl\u00e9e</p>"
+        assert parser.parse_bytes(content.encode("utf-8")).text == parser.parse(content).text
+        doc = parser.parse_bytes(b"  plain text  ")
+        assert isinstance(doc.root, Text)
+        assert doc.root.text == "plain text"
+        assert parser.parse_bytes(b"").root is None
+        doc = parser.parse_bytes(b"\xef\xbb\xbf<p>Marked</p>")
+        assert doc.find_all(Text)[0].text == "Marked"
+        assert len(doc.find_all(Text)) == 1
+
+        doc = ConfluenceParser(raise_on_finish=False).parse_bytes(b"<p>\xff</p>")
+        assert doc.root is None
+        assert any("XML parsing failed" in d for d in doc.metadata["diagnostics"])
+
+    def test_skip_elements(self):
+        """Test skipped elements are dropped along with their subtrees."""
+        content = """
+        <p>Intro</p>
+        <table><tbody><tr><td>Cell</td></tr></tbody></table>
+        <ac:structured-macro ac:name="info"><ac:rich-text-body><p>Panel</p></ac:rich-text-body></ac:structured-macro>
+        """
+        doc = ConfluenceParser(skip_elements={"table", "structured-macro"}).parse(content)
+        assert doc.text == "Intro"
+        assert doc.find_all(PanelMacro) == []
+        assert doc.metadata["diagnostics"] == []
+
+        with pytest.raises(TypeError):
+            ConfluenceParser(skip_elements="table")
+
+    def test_skip_elements_read_by_handlers(self):
+        """Test skipped elements are dropped when handlers read them directly, too."""
+        content = """
+        <ac:structured-macro ac:name="info">
+            <ac:parameter ac:name="bgColor">#FFF</ac:parameter>
+            <ac:rich-text-body><p>Panel</p></ac:rich-text-body>
+        </ac:structured-macro>
+        <ac:structured-macro ac:name="code"><ac:plain-text-body>print()</ac:plain-text-body></ac:structured-macro>
+        <ac:image><ri:attachment ri:filename="a.png"/><ac:caption><p>Caption</p></ac:caption></ac:image>
+        """
+        doc = ConfluenceParser(skip_elements={"rich-text-body", "parameter", "plain-text-body", "caption"}).parse(
+            content
+        )
+        panel = doc.find_all(PanelMacro)[0]
+        assert panel.children == []
+        assert panel.bg_color is None
+        assert doc.find_all(CodeMacro)[0].code == ""
+        image = doc.find_all(Image)[0]
+        assert image.filename == "a.png"
+        assert image.children == []
+
+        adf = """
+        <ac:adf-extension>
+            <ac:adf-node type="panel">
+                <ac:adf-attribute key="panel-type">note</ac:adf-attribute>
+                <ac:adf-content><p>Note</p></ac:adf-content>
+            </ac:adf-node>
+        </ac:adf-extension>
+        """
+        doc = ConfluenceParser(skip_elements={"adf-content"}).parse(adf)
+        assert doc.find_all(PanelMacro)[0].children == []
+        assert ConfluenceParser(skip_elements={"adf-node"}).parse(adf).root is None
+
+        content = """
+        <ac:task-list><ac:task><ac:task-id>1</ac:task-id><ac:task-body>Body</ac:task-body></ac:task></ac:task-list>
+        <ac:structured-macro ac:name="tasks-report-macro">
+            <ac:parameter ac:name="spaces">SPACE</ac:parameter>
+        </ac:structured-macro>
+        """
+        doc = ConfluenceParser(skip_elements={"task-body", "parameter"}).parse(content)
+        task = doc.find_all(ListItem)[0]
+        assert task.task_id == "1"
+        assert task.children == []
+        assert doc.find_all(TasksReportMacro)[0].spaces is None
+
+    def test_parse_returns_independent_documents(self):
+        """Test that parsing the same content twice builds separate documents."""
+        parser = ConfluenceParser()
+        first = parser.parse("<p>Same</p>")
+        second = parser.parse("<p>Same</p>")
+        assert first is not second
+        first.metadata["diagnostics"].append("edited")
+        assert second.metadata["diagnostics"] == []
+
     def test_parse_empty_content(self):
         """Test parsing empty content."""
         parser = ConfluenceParser(raise_on_finish=False)
@@ -72,6 +160,17 @@ class TestConfluenceParser:
         assert doc.root is not None
         assert "Hello world" in doc.text
 
+    def test_parse_plain_text_without_markup(self):
+        """Test parsing content that contains no markup at all."""
+        parser = ConfluenceParser()
+        doc = parser.parse("  Just some text > nothing else  ")
+        assert isinstance(doc.root, Text)
+        assert doc.root.text == "Just some text > nothing else"
+
+        doc = parser.parse("Fish &amp; chips")
+        assert isinstance(doc.root, Text)
+        assert doc.root.text == "Fish & chips"
+
     def test_parse_with_diagnostics_disabled(self):
         """Test parsing with diagnostics collection disabled."""
         parser = ConfluenceParser(raise_on_finish=False)
@@ -79,6 +178,15 @@ class TestConfluenceParser:
         assert isinstance(doc, ConfluenceDocument)
         assert "unknown_element:unknown-element" in doc.metadata.get("diagnostics", [])
 
+    def test_repeated_diagnostics_recorded_once(self):
+        """Test that a problem repeated throughout a document is reported once."""
+        parser = ConfluenceParser(raise_on_finish=False)
+        doc = parser.parse("<p><unknown-element/><unknown-element/><other/><unknown-element/></p>")
+        assert doc.metadata["diagnostics"] == ["unknown_element:unknown-element", "unknown_element:other"]
+
+        doc = parser.parse("<p><unknown-element/></p>")
+        assert doc.metadata["diagnostics"] == ["unknown_element:unknown-element"]
+
     def test_parse_with_diagnostics_enabled_raises(self):
         """Test parsing with diagnostics enabled raises on unknown elements."""
         parser = ConfluenceParser(raise_on_finish=True)
@@ -101,6 +209,12 @@ class TestConfluenceParser:
         # Should remove the problematic character
         assert result == "test  content"
 
+        # Non-ASCII text around surrogates is kept intact
+        assert parser._fix_unicode_surrogates("caf\u00e9 \udc00\u2013 \U0001f600") == "caf\u00e9 \u2013 \U0001f600"
+
+        # Surrogates are dropped before the content reaches the XML parser
+        assert parser.parse("<p>caf\u00e9\ud800 au lait</p>").text == "caf\u00e9 au lait"
+
 
 class TestParserUtilities:
     """Test suite for parser utility methods."""
@@ -159,6 +273,10 @@ class TestParserUtilities:
         assert "middle" in text
         assert "end" in text
 
+        # Test nested text and tails keep document order
+        element = ET.fromstring("<root>a<b>b<c>c</c>d</b>e<f/>g</root>")
+        assert parser._extract_text_content(element) == "abcdeg"
+
     def test_iter_parameters(self):
         """Test parameter iteration utility."""
         parser = ConfluenceParser()
@@ -177,6 +295,73 @@ class TestParserUtilities:
         params = list(parser._iter_parameters(root))
         assert len(params) == 2
 
+    def test_get_parameter_values(self):
+        """Test parameter value collection utility."""
+        parser = ConfluenceParser()
+        from xml.etree import ElementTree as ET
+
+        root = ET.fromstring(
+            f"""
+        <macro xmlns:ac="{parser.NS_AC}">
+            <ac:parameter ac:name="title">Qualified</ac:parameter>
+            <parameter name="colour">Plain</parameter>
+            <ac:parameter ac:name="ignored">Skipped</ac:parameter>
+        </macro>
+        """
+        )
+
+        assert parser._get_parameter_values(root, "title", "colour") == {"title": "Qualified", "colour": "Plain"}
+
+        root = ET.fromstring(
+            f"""
+        <macro xmlns:ac="{parser.NS_AC}" xmlns:ri="{parser.NS_RI}">
+            <ac:parameter name="language" ac:name="x">py</ac:parameter>
+            <ac:parameter ri:name="title">Fallback</ac:parameter>
+        </macro>
+        """
+        )
+
+        assert parser._get_parameter_values(root, "language", "title", "x") == {"language": "py", "title": "Fallback"}
+
+    def test_get_adf_attributes(self):
+        """Test ADF attribute collection utility."""
+        parser = ConfluenceParser()
+        from xml.etree import ElementTree as ET
+
+        root = ET.fromstring(
+            f"""
+        <adf-node xmlns:ac="{parser.NS_AC}">
+            <ac:adf-attribute key="panel-type">note</ac:adf-attribute>
+            <ac:adf-attribute>No key</ac:adf-attribute>
+            <ac:adf-attribute key="bg-color">#E3FCEF</ac:adf-attribute>
+        </adf-node>
+        """
+        )
+
+        assert parser._get_adf_attributes(root) == {"panel-type": "note", "bg-color": "#E3FCEF"}
+
+        root = ET.fromstring(
+            f"""
+        <adf-node xmlns:ac="{parser.NS_AC}">
+            <ac:adf-attribute key="bg-color">#1</ac:adf-attribute>
+            <ac:adf-attribute key="bgColor">#2</ac:adf-attribute>
+        </adf-node>
+        """
+        )
+
+        assert parser._get_adf_attributes(root) == {"bg-color": "#2"}
+
+    def test_index_children(self):
+        """Test children index utility."""
+        parser = ConfluenceParser()
+        from xml.etree import ElementTree as ET
+
+        root = ET.fromstring("<macro><parameter>1</parameter><body>b</body><parameter>2</parameter></macro>")
+        index = parser._index_children(root)
+        assert [param.text for param in index["parameter"]] == ["1", "2"]
+        assert [body.text for body in index["body"]] == ["b"]
+        assert "missing" not in index
+
     def test_css_style_parsing_edge_cases(self):
         """Test CSS style parsing with edge cases."""
         parser = ConfluenceParser()
@@ -198,6 +383,10 @@ class TestParserUtilities:
         assert styles["color"] == "red"
         assert styles["margin"] == "10px"
 
+        # Test repeated style strings yield independent dicts
+        styles["color"] = "blue"
+        assert parser._parse_css_styles(element) == {"color": "red", "margin": "10px"}
+
 
 class TestParserComplexScenarios:
     """Test suite for complex parsing scenarios."""
@@ -221,6 +410,17 @@ class TestParserComplexScenarios:
         # Should return the single child directly
         assert isinstance(doc.root, HeadingElement)
 
+    def test_top_level_text_between_elements(self):
+        """Test that text around top-level elements is kept in document order."""
+        parser = ConfluenceParser()
+        content = "Intro <p>First</p> middle <p>Second</p> outro"
+        doc = parser.parse(content)
+
+        assert isinstance(doc.root, Fragment)
+        children = doc.root.children
+        assert [type(child) for child in children] == [Text, TextBreakElement, Text, TextBreakElement, Text]
+        assert [child.text for child in children if isinstance(child, Text)] == ["Intro", "middle", "outro"]
+
     def test_tasks_report_macro_boolean_parsing(self):
         """Test tasks report macro with boolean parameter parsing."""
         parser = ConfluenceParser()
@@ -294,6 +494,74 @@ class TestParserComplexScenarios:
         assert panel.panel_icon_id == "warning-icon"
         assert panel.panel_icon_text == "Warning"
 
+    def test_subclass_handler_overrides(self):
+        """Test that handler methods overridden in a subclass are dispatched to."""
+
+        class CustomParser(ConfluenceParser):
+            def _parse_code_macro(self, element):
+                return CodeMacro(language="custom", code="")
+
+            def _parse_paragraph(self, element):
+                return Text(text="custom paragraph")
+
+        content = (
+            "<p>Para</p>"
+            '<ac:structured-macro ac:name="code"><ac:plain-text-body>x</ac:plain-text-body></ac:structured-macro>'
+        )
+        doc = CustomParser().parse(content)
+        assert doc.find_all(CodeMacro)[0].language == "custom"
+        assert doc.find_all(Text)[0].text == "custom paragraph"
+
+        doc = ConfluenceParser().parse(content)
+        assert doc.find_all(CodeMacro)[0].language is None
+
+    def test_subclass_handler_tables(self):
+        """Test that subclasses can extend the read-only dispatch tables with any callable."""
+        from functools import partial
+
+        def labelled(parser, element, label):
+            return Text(text=label)
+
+        class ExtendedParser(ConfluenceParser):
+            _macro_parsers = {**ConfluenceParser._macro_parsers, "custom": partial(labelled, label="extended")}
+
+        doc = ExtendedParser().parse('<ac:structured-macro ac:name="custom"/>')
+        assert doc.root.text == "extended"
+
+        parser = ConfluenceParser()
+        with pytest.raises(TypeError):
+            parser._macro_parsers["custom"] = labelled
+        assert "custom" not in ConfluenceParser()._macro_parsers
+
+    def test_concurrent_parses_share_one_parser(self):
+        """Test that threads parsing through one parser instance each get their own document."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        parser = ConfluenceParser()
+        contents = [f"<p>Document {i}</p>" + "<p><strong>filler</strong> text</p>" * 200 for i in range(20)]
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            documents = list(executor.map(parser.parse, contents))
+
+        for i, doc in enumerate(documents):
+            assert doc.root.children[0].to_text() == f"Document {i}"
+            assert len(doc.root.children) == 201
+
+    def test_reentrant_parse_from_handler(self):
+        """Test that a handler may parse nested content with the same parser."""
+
+        class NestingParser(ConfluenceParser):
+            def _parse_code_macro(self, element):
+                return self.parse("<p>inner</p>").root
+
+        content = (
+            "<p>a</p>"
+            '<ac:structured-macro ac:name="code"><ac:plain-text-body>x</ac:plain-text-body></ac:structured-macro>'
+            "<p>b</p>"
+        )
+        doc = NestingParser().parse(content)
+        assert [child.to_text() for child in doc.root.children] == ["a", "inner", "b"]
+
 
 class TestParserErrorHandling:
     """Test suite for parser error handling."""
@@ -307,6 +575,35 @@ class TestParserErrorHandling:
         diagnostics = doc.metadata.get("diagnostics", [])
         assert any("XML parsing failed" in d for d in diagnostics)
 
+    def test_xml_parse_error_after_handled_elements(self):
+        """Test that malformed input reports only the XML error, whatever handlers did before it."""
+        parser = ConfluenceParser(raise_on_finish=False)
+
+        doc = parser.parse("<unknown/><p>unclosed")
+        assert doc.root is None
+        assert len(doc.metadata["diagnostics"]) == 1
+        assert doc.metadata["diagnostics"][0].startswith("XML parsing failed")
+
+        doc = parser.parse('<ac:layout-section ac:type="bogus"/><p>unclosed')
+        assert doc.root is None
+        assert len(doc.metadata["diagnostics"]) == 1
+        assert doc.metadata["diagnostics"][0].startswith("XML parsing failed")
+
+    def test_parser_reusable_after_failures(self):
+        """Test that a parser instance recovers after malformed input or a failing handler."""
+        parser = ConfluenceParser(raise_on_finish=False)
+
+        doc = parser.parse("<p>Unclosed <strong>tag</p>")
+        assert doc.root is None
+        doc = parser.parse("<p>After XML error</p>")
+        assert doc.text == "After XML error"
+
+        with pytest.raises(ValueError):
+            parser.parse('<ac:layout-section ac:type="bogus"/><p>Never reached</p>')
+        doc = parser.parse("<p>After handler error</p>")
+        assert doc.text == "After handler error"
+        assert doc.metadata["diagnostics"] == []
+
     def test_skipped_elements(self):
         """Test that certain elements are skipped without generating diagnostics."""
         parser = ConfluenceParser(raise_on_finish=False)
@@ -338,6 +635,22 @@ class TestParserErrorHandling:
         # Start should be None when parsing fails
         assert lists[0].start is None
 
+    def test_numeric_attribute_parsing(self):
+        """Test integer attributes on lists and table cells."""
+        parser = ConfluenceParser()
+        content = """
+        <ol start=" 3 "><li>Item</li></ol>
+        <ol start="-2"><li>Item</li></ol>
+        <ol start="\u00b2"><li>Item</li></ol>
+        <table><tbody><tr><td rowspan="2" colspan="wide">Cell</td></tr></tbody></table>
+        """
+        doc = parser.parse(content)
+
+        assert [element.start for element in doc.find_all(ListElement)] == [3, -2, None]
+        cell = doc.find_all(TableCell)[0]
+        assert cell.rowspan == 2
+        assert cell.colspan is None
+
     def test_unknown_macro_handling(self):
         """Test handling of unknown macros."""
         parser = ConfluenceParser(raise_on_finish=False)
@@ -613,6 +926,28 @@ class TestParserMacroHandling:
         assert task.spaces == "SPACE1,SPACE2"
         assert task.is_missing_required_parameters is True
 
+    def test_tasks_report_macro_boolean_spellings(self):
+        """Test boolean parameter values are matched ignoring case and surrounding whitespace."""
+        parser = ConfluenceParser()
+        template = (
+            '<ac:structured-macro ac:name="tasks-report-macro">'
+            '<ac:parameter ac:name="isMissingRequiredParameters">{}</ac:parameter>'
+            "</ac:structured-macro>"
+        )
+        for value, expected in [
+            ("TRUE", True),
+            (" tRuE ", True),
+            ("Yes", True),
+            ("1", True),
+            ("False", False),
+            ("\n false\t", False),
+            ("no", False),
+            ("0", False),
+            ("x", False),
+        ]:
+            doc = parser.parse(template.format(value))
+            assert doc.find_all(TasksReportMacro)[0].is_missing_required_parameters is expected
+
     def test_excerpt_include_macro_parsing(self):
         """Test excerpt include macro parsing with version_at_save."""
         parser = ConfluenceParser()
@@ -707,6 +1042,25 @@ class TestParserMacroHandling:
         assert links[0].type == LinkType.EXTERNAL
         assert links[0].href == "https://example.com"
 
+    def test_link_resource_fields(self):
+        """Test link fields are populated from the linked resource identifier."""
+        parser = ConfluenceParser()
+        content = """
+        <ac:link><ri:page ri:space-key="DOC" ri:content-title="Home" ri:version-at-save="7"/></ac:link>
+        <ac:link><ri:attachment ri:filename="file.pdf"/></ac:link>
+        <ac:link ac:anchor="top"><ri:user ri:account-id="acc-1"/></ac:link>
+        """
+        doc = parser.parse(content)
+        page, attachment, user = doc.find_all(LinkElement)
+        assert page.space_key == "DOC"
+        assert page.content_title == "Home"
+        assert page.version_at_save == "7"
+        assert attachment.type == LinkType.ATTACHMENT
+        assert attachment.filename == "file.pdf"
+        assert attachment.space_key is None
+        assert user.type == LinkType.ANCHOR
+        assert user.account_id == "acc-1"
+
     def test_link_body_parsing(self):
         """Test link body parsing as fragment."""
         parser = ConfluenceParser()
@@ -763,6 +1117,52 @@ class TestParserMacroHandling:
         assert images[0].filename == "test-image.png"
         assert images[0].version_at_save == "2"
 
+    def test_image_custom_width_parsing(self):
+        """Test boolean parsing of the image custom-width attribute."""
+        parser = ConfluenceParser()
+        content = '<ac:image ac:custom-width="true"/><ac:image ac:custom-width="False"/><ac:image/>'
+        doc = parser.parse(content)
+        images = doc.find_all(Image)
+        assert [image.custom_width for image in images] == [True, False, None]
+
+    def test_image_attribute_precedence(self):
+        """Test the bare image attribute wins over namespaced spellings of the same field."""
+        parser = ConfluenceParser()
+        content = '<ac:image ac:width="10" width="20" ri:height="5" ac:height="6" ac:align="center"/>'
+        image = parser.parse(content).find_all(Image)[0]
+        assert image.width == "20"
+        assert image.height == "6"
+        assert image.alignment == "center"
+
+    def test_resource_identifier_attributes(self):
+        """Test resource identifier attribute mapping across namespace variants."""
+        parser = ConfluenceParser()
+        content = """
+        <ac:link><ri:user ri:account-id="acc-1" ri:local-id="loc-1" ri:userkey="key-1"/></ac:link>
+        <ac:link><ri:shortcut ri:key="jira" ri:parameter="ABC-1"/></ac:link>
+        <ac:link><ri:content-entity content-id="123" ri:unknown="ignored"/></ac:link>
+        """
+        doc = parser.parse(content)
+        user, shortcut, entity = doc.find_all(ResourceIdentifier)
+        assert user.account_id == "acc-1"
+        assert user.local_id == "loc-1"
+        assert user.userkey == "key-1"
+        assert user.space_key is None
+        assert shortcut.key == "jira"
+        assert shortcut.parameter == "ABC-1"
+        assert entity.content_id == "123"
+
+    def test_resource_identifier_attribute_precedence(self):
+        """Test the bare attribute wins over namespaced spellings of the same field."""
+        parser = ConfluenceParser()
+        content = """
+        <ac:link><ri:page ri:content-title="A" content-title="B"/></ac:link>
+        <ac:link><ri:page at:space-key="AT" ri:space-key="RI" ac:space-key="AC"/></ac:link>
+        """
+        bare, namespaced = parser.parse(content).find_all(ResourceIdentifier)
+        assert bare.content_title == "B"
+        assert namespaced.space_key == "AC"
+
 
 if __name__ == "__main__":
     pytest.main([__file__])